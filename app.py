@@ -1,5 +1,5 @@
 import cv2
-from compression.quadtree import QuadTree
+from compression.image.quadtree import QuadTree
 
 
 if __name__ == '__main__':
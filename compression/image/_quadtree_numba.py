@@ -0,0 +1,109 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Fallback for numba.njit when numba is not installed, the kernels then run as plain Python.
+        """
+        if args and callable(args[0]):
+            return args[0]
+
+        return lambda function: function
+
+
+@njit(cache=True)
+def _grow(nodes: np.ndarray, colors: np.ndarray, capacity: int) -> tuple:
+    """
+    Kernel to grow the node buffers to a new capacity.
+    :param nodes: Node buffer to be grown.
+    :param colors: Color buffer to be grown.
+    :param capacity: New capacity of the buffers.
+    :return: A tuple containing the grown node and color buffers.
+    """
+    grown_nodes = np.empty((capacity, nodes.shape[1]), dtype=nodes.dtype)
+    grown_nodes[:nodes.shape[0]] = nodes
+
+    grown_colors = np.empty((capacity, colors.shape[1]), dtype=colors.dtype)
+    grown_colors[:colors.shape[0]] = colors
+
+    return grown_nodes, grown_colors
+
+
+@njit(cache=True)
+def build_tree(integral: np.ndarray, sq_integral: np.ndarray, threshold: float, min_quad_size: int) -> tuple:
+    """
+    Kernel to build a quadtree from the integral images of the target image.
+    :param integral: Summed-area table of the image, with shape (height + 1, width + 1, channels).
+    :param sq_integral: Summed-area table of the squared image, with the same shape as integral.
+    :param threshold: Threshold value for quadrant split, 0 to split regardless of the error.
+    :param min_quad_size: Minimum size of the quadrant, 0 for no minimum.
+    :return: A tuple of node arrays (x, y, width, height, depth, first_child, color). The root is at index 0, the four
+    children of a node are stored contiguously from first_child, which is -1 for the leaves.
+    """
+    height, width, channels = integral.shape[0] - 1, integral.shape[1] - 1, integral.shape[2]
+
+    capacity = 1024
+    nodes = np.empty((capacity, 6), dtype=np.int32)
+    colors = np.empty((capacity, channels), dtype=np.float64)
+
+    nodes[0, 0], nodes[0, 1], nodes[0, 2], nodes[0, 3], nodes[0, 4], nodes[0, 5] = 0, 0, width, height, 0, -1
+    count = 1
+
+    # Depth-first with four children pushed per split, so the stack never holds more than 3 * depth + 1 nodes. The
+    # quadrants are visited in Z-order, so consecutive lookups in the integral images already fall in nearby rows and
+    # the whole-image tables are queried directly, without tiling.
+    stack = np.empty(256, dtype=np.int64)
+    stack[0] = 0
+    top = 1
+
+    while top > 0:
+        top -= 1
+        index = stack[top]
+        x, y, w, h, depth = nodes[index, 0], nodes[index, 1], nodes[index, 2], nodes[index, 3], nodes[index, 4]
+        area = w * h
+
+        variance = 0.0
+        for c in range(channels):
+            total = integral[y + h, x + w, c] - integral[y, x + w, c] - integral[y + h, x, c] + integral[y, x, c]
+            sq_total = (sq_integral[y + h, x + w, c] - sq_integral[y, x + w, c] - sq_integral[y + h, x, c] +
+                        sq_integral[y, x, c])
+
+            mean = total / area
+            colors[index, c] = mean
+            variance += max(sq_total / area - mean * mean, 0.0)
+
+        if threshold > 0 and np.sqrt(variance / channels) <= threshold:
+            continue
+
+        bottom_width, bottom_height = w >> 1, h >> 1
+        top_width, top_height = w - bottom_width, h - bottom_height
+
+        if bottom_width < 1 or bottom_height < 1:
+            continue
+
+        if min_quad_size > 0 and (bottom_width <= min_quad_size or bottom_height <= min_quad_size):
+            continue
+
+        if count + 4 > capacity:
+            capacity *= 2
+            nodes, colors = _grow(nodes, colors, capacity)
+
+        # Children are stored top-left, top-right, bottom-left, bottom-right.
+        nodes[index, 5] = count
+        for quadrant in range(4):
+            right, bottom = quadrant & 1, quadrant >> 1
+
+            nodes[count, 0] = x + right * bottom_width
+            nodes[count, 1] = y + bottom * bottom_height
+            nodes[count, 2] = top_width if right else bottom_width
+            nodes[count, 3] = top_height if bottom else bottom_height
+            nodes[count, 4], nodes[count, 5] = depth + 1, -1
+
+            stack[top] = count
+            top += 1
+            count += 1
+
+    return (nodes[:count, 0].copy(), nodes[:count, 1].copy(), nodes[:count, 2].copy(), nodes[:count, 3].copy(),
+            nodes[:count, 4].copy(), nodes[:count, 5].copy(), colors[:count].copy())
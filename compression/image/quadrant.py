@@ -1,12 +1,7 @@
+import cv2
 import numpy as np
-from copy import deepcopy
 
-
-class QuadrantRepresentationError(Exception):
-    """
-    Exception to raise when the Quadrant color is not set.
-    """
-    pass
+__all__ = ['Quadrant']
 
 
 class Quadrant:
@@ -14,6 +9,8 @@ class Quadrant:
     A class to represent a quadrant (Node) in a quadtree.
     """
 
+    __slots__ = ('x', 'y', '__width', '__height', '__depth', '__children')
+
     def __init__(self, x: int, y: int, width: int, height: int, depth: int = 0) -> None:
         """
         Constructor for the Quadrant class.
@@ -23,21 +20,21 @@ class Quadrant:
         :param height: Height of the quadrant in the quadtree.
         :param depth: Depth of the quadrant in the quadtree.
         """
-        self.__origin = {'x': x, 'y': y}
+        self.x = x
+        self.y = y
         self.__width = width
         self.__height = height
 
         self.__depth = depth
         self.__children = []
-        self.__color = None
 
     @property
-    def origin(self) -> dict:
+    def origin(self) -> tuple:
         """
         Getter for the origin of the quadrant.
-        :return: Origin of the quadrant.
+        :return: Origin (x, y) of the quadrant.
         """
-        return deepcopy(self.__origin)
+        return self.x, self.y
 
     @property
     def width(self) -> int:
@@ -93,37 +90,36 @@ class Quadrant:
         :param image: Target image to extract the quadrant from.
         :return: Quadrant of the image.
         """
-        return image[self.__origin['y']:self.__origin['y'] + self.__height,
-               self.__origin['x']:self.__origin['x'] + self.__width]
+        return image[self.y:self.y + self.__height, self.x:self.x + self.__width]
 
-    def calc_error(self, image: np.ndarray) -> float:
+    def calc_error(self, image: np.ndarray) -> tuple:
         """
         Method to calculate the error of the quadrant.
         :param image: Target image to calculate the error from.
-        :return: Error (std) of the quadrant considering the mean color.
+        :return: A tuple containing the error (std) of the quadrant considering the mean color, and the mean color.
         """
         quadrant = self.get_quadrant_from_image(image)
-        mean_color = self.calc_mean_color(quadrant)
+        channels = quadrant.shape[2] if quadrant.ndim == 3 else 1
+
+        # cv2.meanStdDev handles up to 4 channels.
+        if channels > 4:
+            pixels = quadrant.reshape(-1, channels).astype(np.float32)
+            return float(np.sqrt(np.mean(np.var(pixels, axis=0)))), [int(m) for m in np.mean(pixels, axis=0)]
 
-        return np.sqrt(np.mean((quadrant - mean_color) ** 2))
+        means, stddevs = cv2.meanStdDev(quadrant)
 
-    def calc_mean_color(self, quadrant: np.ndarray) -> np.ndarray:
+        return float(np.sqrt(np.mean(stddevs ** 2))), [int(m) for m in means.flatten()]
+
+    def calc_mean_color(self, quadrant: np.ndarray) -> list:
         """
         Method to calculate the mean color of the quadrant.
         :param quadrant: Target quadrant to calculate the mean color from.
         :return: Mean color of the quadrant.
         """
-        if not self.__color:
-            self.__color = [int(p) for p in np.mean(quadrant, axis=(0, 1))]
-
-        return self.__color
+        channels = quadrant.shape[2] if quadrant.ndim == 3 else 1
 
-    def __str__(self) -> str:
-        """
-        String representation of the Quadrant class.
-        :return: String representation of the Quadrant class.
-        """
-        if not self.__color:
-            raise QuadrantRepresentationError("Quadrant color is not set. Please calculate the mean color first!")
+        # cv2.mean handles up to 4 channels and always returns 4 values.
+        if channels > 4:
+            return [int(p) for p in np.mean(quadrant, axis=(0, 1))]
 
-        return f"{self.__origin['x']};{self.__origin['y']};{self.__origin['x'] + self.__width};{self.__origin['y'] + self.__height};{','.join(str(l) for l in self.__color)}"
+        return [int(p) for p in cv2.mean(quadrant)[:channels]]
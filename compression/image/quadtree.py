@@ -1,9 +1,21 @@
 import os
 import cv2
 import numpy as np
-from copy import deepcopy
 
-from compression.quadrant import Quadrant
+from compression.image.quadrant import Quadrant
+from compression.image.quadtree_arrays import QuadTreeArrays
+from compression.image._quadtree_numba import build_tree
+
+__all__ = ['QuadTree', 'LIMA_HEADER', 'LIMA_RECORD']
+
+# Size groups are painted with a single indexed assignment only when they hold at least this many quadrants of at most
+# this many pixels, otherwise each quadrant is painted with a slice assignment.
+MIN_BATCH_QUADRANTS = 64
+MAX_BATCH_AREA = 64
+
+# Binary layout of the ".lima" file: a header with the image shape followed by one record per leaf quadrant.
+LIMA_HEADER = np.dtype([('height', '<u2'), ('width', '<u2')])
+LIMA_RECORD = np.dtype([('x', '<u2'), ('y', '<u2'), ('width', '<u2'), ('height', '<u2'), ('color', 'u1', (3,))])
 
 
 class QuadTree:
@@ -14,24 +26,35 @@ class QuadTree:
     def __init__(self, image: np.ndarray, threshold: int = None, min_quad_size: int = 1) -> None:
         """
         Constructor for the QuadTree class.
-        :param image: Image to be compressed.
+        :param image: Image to be compressed, kept by reference and never modified.
         :param threshold: Threshold value for quadrant split.
         :param min_quad_size: Minimum size of the quadrant.
         """
-        self.__image = deepcopy(image)
+        self.__image = image
+        integral, sq_integral = cv2.integral2(self.__image, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+
+        shape = (image.shape[0] + 1, image.shape[1] + 1, -1)
+        *nodes, color = build_tree(integral.reshape(shape), sq_integral.reshape(shape), float(threshold or 0),
+                                   int(min_quad_size or 0))
+        self.__nodes = QuadTreeArrays(*nodes, color=color.astype(image.dtype))
+        self.__root = None
 
-        self.__threshold = threshold
-        self.__min_quad_size = min_quad_size
+    @property
+    def root(self) -> Quadrant:
+        """
+        Getter for the root of the quadtree. The Quadrant objects are only built on first access.
+        """
+        if self.__root is None:
+            self.__root = self.__build_quadrants()
 
-        self.root = Quadrant(0, 0, image.shape[1], image.shape[0], 0)
-        self.__build_tree(self.root)
+        return self.__root
 
     @property
     def max_depth(self) -> int:
         """
         Getter for the maximum depth of the quadtree.
         """
-        return self.__get_max_depth(self.root)
+        return int(self.__nodes.depth.max())
 
     def get_children(self) -> list[Quadrant]:
         """
@@ -46,36 +69,47 @@ class QuadTree:
         :param highlight_color: Color to highlight the quadrants.
         """
         compressed_image = np.zeros_like(self.__image)
-        children = self.get_children()
-
-        for child in children:
-            quadrant = child.get_quadrant_from_image(self.__image)
-            compressed_image[child.origin['y']:child.origin['y'] + child.height,
-            child.origin['x']:child.origin['x'] + child.width, :] = child.calc_mean_color(quadrant)
+        nodes = self.__nodes
+        leaves = nodes.leaves
+        QuadTree.__paint_quadrants(compressed_image, nodes.x[leaves], nodes.y[leaves], nodes.width[leaves],
+                                   nodes.height[leaves], nodes.color[leaves])
 
         if show_quadrants:
-            for child in children:
-                imgc = cv2.rectangle(compressed_image, (child.origin['x'], child.origin['y']),
-                                     (child.origin['x'] + child.width, child.origin['y'] + child.height),
-                                     highlight_color, 1)
+            x, y = nodes.x[leaves].tolist(), nodes.y[leaves].tolist()
+            x2, y2 = (nodes.x[leaves] + nodes.width[leaves]).tolist(), (nodes.y[leaves] + nodes.height[leaves]).tolist()
+
+            for i in range(len(leaves)):
+                cv2.rectangle(compressed_image, (x[i], y[i]), (x2[i], y2[i]), highlight_color, 1)
 
         return compressed_image
 
     def build_compressed_file(self, save_path: str = None, filename: str = None) -> None:
         """
         Method to build a compressed file from the quadtree. creates a file with ".lima" extension which contains the
-        instructions for the compressed file construction.
+        instructions for the compressed file construction, packed as binary records of the leaf quadrants.
         :param save_path: Path to save the compressed file.
         :param filename: Name of the compressed file.
         """
         if not (save_path and filename):
             raise ValueError('Please provide a save path and filename!')
 
-        quadrants = self.get_children()
-        compressed_data = '&'.join([str(quad) for quad in quadrants])
+        if max(self.__image.shape[:2]) > np.iinfo(np.uint16).max:
+            raise ValueError('Image is too large for the ".lima" format!')
+
+        if self.__image.dtype != np.uint8 or not (self.__image.ndim == 2 or self.__image.shape[2] == 3):
+            raise ValueError('The ".lima" format only supports 3-channel or grayscale uint8 images!')
 
-        with open(os.path.join(save_path, f'{filename}.lima'), 'w') as file:
-            file.write(f'{self.__image.shape[0]};{self.__image.shape[1]}&{compressed_data}')
+        nodes = self.__nodes
+        leaves = nodes.leaves
+
+        header = np.array([self.__image.shape[:2]], dtype=LIMA_HEADER)
+        records = np.empty(len(leaves), dtype=LIMA_RECORD)
+        records['x'], records['y'] = nodes.x[leaves], nodes.y[leaves]
+        records['width'], records['height'] = nodes.width[leaves], nodes.height[leaves]
+        records['color'] = nodes.color[leaves]
+
+        with open(os.path.join(save_path, f'{filename}.lima'), 'wb') as file:
+            file.write(header.tobytes() + records.tobytes())
 
     @staticmethod
     def parse_compressed_file(file_path: str) -> np.ndarray:
@@ -87,78 +121,79 @@ class QuadTree:
         if not file_path.endswith('.lima'):
             raise ValueError('Invalid file extension!')
 
-        with open(file_path, 'r') as file:
-            data = file.read().split('&')
+        with open(file_path, 'rb') as file:
+            data = file.read()
 
-        shape = data[0].split(';')
-        parsed_image = np.zeros((int(shape[0]), int(shape[1]), 3), dtype=np.uint8)
+        header = np.frombuffer(data, dtype=LIMA_HEADER, count=1)[0]
+        records = np.frombuffer(data, dtype=LIMA_RECORD, offset=LIMA_HEADER.itemsize)
+        parsed_image = np.zeros((int(header['height']), int(header['width']), 3), dtype=np.uint8)
 
-        for quad_data in data[1:]:
-            quad = quad_data.split(';')
-            color = [int(c) for c in quad[-1].split(',')]
-            parsed_image[int(quad[1]):int(quad[3]), int(quad[0]):int(quad[2]), :] = color
+        QuadTree.__paint_quadrants(parsed_image, records['x'], records['y'], records['width'], records['height'],
+                                   records['color'])
 
         return parsed_image
 
-    def __get_max_depth(self, quadrant: Quadrant) -> int:
-        """
-        Method to get the maximum depth of the quadtree recursively.
-        :param quadrant: Quadrant to get the depth from.
-        """
-        if not quadrant.children:
-            return quadrant.depth
-
-        max_depth = 0
-        for child in quadrant.children:
-            max_depth = max(max_depth, self.__get_max_depth(child))
-
-        return max_depth
+    @staticmethod
+    def __paint_quadrants(image: np.ndarray, x: np.ndarray, y: np.ndarray, width: np.ndarray, height: np.ndarray,
+                          color: np.ndarray) -> None:
+        """
+        Static Method to paint quadrants onto an image. Quadrants are grouped by size, large groups of small quadrants
+        are painted with a single indexed assignment and the remaining ones with one slice assignment each.
+        :param image: Image to paint the quadrants onto.
+        :param x: Origin X-coordinate of each quadrant.
+        :param y: Origin Y-coordinate of each quadrant.
+        :param width: Width of each quadrant.
+        :param height: Height of each quadrant.
+        :param color: Color of each quadrant.
+        """
+        sizes = width.astype(np.int64) << 32 | height.astype(np.int64)
+        order = np.argsort(sizes, kind='stable')
+        keys, starts = np.unique(sizes[order], return_index=True)
+
+        for key, indices in zip(keys.tolist(), np.split(order, starts[1:])):
+            w, h = key >> 32, key & 0xFFFFFFFF
+
+            # Indexed assignment pays per pixel, so it only beats slicing when it replaces many small slices.
+            if len(indices) < MIN_BATCH_QUADRANTS or w * h > MAX_BATCH_AREA:
+                for i, qx, qy in zip(indices.tolist(), x[indices].tolist(), y[indices].tolist()):
+                    image[qy:qy + h, qx:qx + w] = color[i]
+                continue
+
+            rows = y[indices, None, None].astype(np.intp) + np.arange(h)[None, :, None]
+            cols = x[indices, None, None].astype(np.intp) + np.arange(w)[None, None, :]
+            image[rows, cols] = color[indices].reshape((len(indices), 1, 1) + image.shape[2:])
 
     def __get_children(self, quadrant: Quadrant) -> list[Quadrant]:
         """
-        Method to get the leaves of the quadtree recursively.
+        Method to get the leaves of the quadtree iteratively, from top-left to bottom-right.
         :param quadrant: Quadrant to get the leaves from.
         """
-        if not quadrant.children:
-            return [quadrant]
-
         children = []
-        for child in quadrant.children:
-            children.extend(self.__get_children(child))
+        stack = [quadrant]
+
+        while stack:
+            node = stack.pop()
+
+            if not node.children:
+                children.append(node)
+            else:
+                stack.extend(reversed(node.children))
 
         return children
 
-    def __build_tree(self, quadrant: Quadrant) -> None:
+    def __build_quadrants(self) -> Quadrant:
         """
-        Method to build the quadtree recursively.
-        :param quadrant: Quadrant to be split.
+        Method to build the Quadrant objects from the node arrays of the quadtree.
+        :return: Root quadrant of the quadtree.
         """
+        nodes = self.__nodes
+        x, y, width, height = nodes.x.tolist(), nodes.y.tolist(), nodes.width.tolist(), nodes.height.tolist()
+        depth, first_child = nodes.depth.tolist(), nodes.first_child.tolist()
 
-        if self.__threshold and quadrant.calc_error(self.__image) <= self.__threshold:
-            return
-
-        bottom_width, top_width = np.floor(quadrant.width / 2).astype(int), np.ceil(quadrant.width / 2).astype(int)
-        bottom_height, top_height = np.floor(quadrant.height / 2).astype(int), np.ceil(quadrant.height / 2).astype(int)
-
-        if bottom_width < 1 or bottom_height < 1:
-            return
-
-        if self.__min_quad_size and (bottom_width <= self.__min_quad_size or bottom_height <= self.__min_quad_size):
-            return
-
-        top_left = Quadrant(quadrant.origin['x'], quadrant.origin['y'], bottom_width, bottom_height, quadrant.depth + 1)
-        self.__build_tree(top_left)
-
-        top_right = Quadrant(quadrant.origin['x'] + bottom_width, quadrant.origin['y'], top_width, bottom_height,
-                             quadrant.depth + 1)
-        self.__build_tree(top_right)
-
-        bottom_left = Quadrant(quadrant.origin['x'], quadrant.origin['y'] + bottom_height, bottom_width, top_height,
-                               quadrant.depth + 1)
-        self.__build_tree(bottom_left)
+        quadrants = [Quadrant(x[i], y[i], width[i], height[i], depth[i]) for i in range(len(nodes))]
 
-        bottom_right = Quadrant(quadrant.origin['x'] + bottom_width, quadrant.origin['y'] + bottom_height, top_width,
-                                top_height, quadrant.depth + 1)
-        self.__build_tree(bottom_right)
+        for quadrant, child in zip(quadrants, first_child):
+            if child >= 0:
+                quadrant.children = quadrants[child:child + 4]
 
-        quadrant.children = [top_left, top_right, bottom_left, bottom_right]
\ No newline at end of file
+        return quadrants[0]
@@ -0,0 +1,44 @@
+import numpy as np
+
+__all__ = ['QuadTreeArrays']
+
+
+class QuadTreeArrays:
+    """
+    A class to represent the nodes of a quadtree as a structure of arrays, one entry per node.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, width: np.ndarray, height: np.ndarray, depth: np.ndarray,
+                 first_child: np.ndarray, color: np.ndarray) -> None:
+        """
+        Constructor for the QuadTreeArrays class.
+        :param x: Origin X-coordinate of each node.
+        :param y: Origin Y-coordinate of each node.
+        :param width: Width of each node.
+        :param height: Height of each node.
+        :param depth: Depth of each node.
+        :param first_child: Index of the first of the four contiguous children of each node, -1 for the leaves.
+        :param color: Mean color of each node, with shape (nodes, channels).
+        """
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.depth = depth
+        self.first_child = first_child
+        self.color = color
+
+    @property
+    def leaves(self) -> np.ndarray:
+        """
+        Getter for the indices of the leaf nodes.
+        :return: Indices of the leaf nodes.
+        """
+        return np.flatnonzero(self.first_child < 0)
+
+    def __len__(self) -> int:
+        """
+        Method to get the number of nodes.
+        :return: Number of nodes.
+        """
+        return len(self.x)
@@ -0,0 +1,37 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+from libc.stdint cimport uint8_t, uint32_t, uint64_t
+
+
+def encode(const uint32_t[::1] text, const uint64_t[::1] bits, const uint8_t[::1] nbits) -> bytes:
+    """
+    Function to pack the Huffman codes of a text into bytes.
+    :param text: Symbol index of each character of the text.
+    :param bits: Huffman code of each symbol, at most 56 bits long.
+    :param nbits: Number of bits of the Huffman code of each symbol.
+    :return: The encoded text packed into bytes, most significant bit first and zero-padded at the end.
+    """
+    cdef Py_ssize_t i, size = 0
+    cdef uint64_t total = 0, buffer = 0
+    cdef unsigned int buffered = 0
+    cdef uint32_t symbol
+
+    for i in range(text.shape[0]):
+        total += nbits[text[i]]
+
+    encoded = bytearray((total + 7) // 8)
+    cdef unsigned char[::1] out = encoded
+
+    for i in range(text.shape[0]):
+        symbol = text[i]
+        buffer = (buffer << nbits[symbol]) | bits[symbol]
+        buffered += nbits[symbol]
+
+        while buffered >= 8:
+            buffered -= 8
+            out[size] = (buffer >> buffered) & 0xFF
+            size += 1
+
+    if buffered:
+        out[size] = (buffer << (8 - buffered)) & 0xFF
+
+    return bytes(encoded)
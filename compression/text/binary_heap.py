@@ -1,6 +1,3 @@
-from copy import deepcopy
-
-
 class BinaryHeap:
     """
     A class to represent a binary heap.
@@ -12,16 +9,16 @@ class BinaryHeap:
         :param data: Initial list of elements to build the heap.
         :param criteria: Comparison function to establish heap order.
         """
-        self.__data = deepcopy(data)
+        self.__data = list(data)
         self.__criteria = criteria
         self.__bottom_up_heapify()
 
     def get_heap(self) -> list[any]:
         """
         Getter for the heap.
-        :return: A deep copy of the heap data.
+        :return: A copy of the heap data.
         """
-        return deepcopy(self.__data)
+        return list(self.__data)
 
     def push(self, value: any) -> None:
         """
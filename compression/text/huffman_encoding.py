@@ -1,5 +1,18 @@
+import heapq
+from collections import Counter
+from itertools import count
+
+import numpy as np
+
 from .huffnode import HuffNode
-from .binary_heap import BinaryHeap
+
+try:
+    from ._huffman_c import encode as _encode_c
+except ImportError:
+    _encode_c = None
+
+# Largest number of internal tree nodes decoded through the byte transition table, which holds 256 entries per node.
+MAX_TABLE_STATES = 256
 
 
 class HuffmanEncoding:
@@ -19,15 +32,7 @@ class HuffmanEncoding:
         :param content: The string content to analyze.
         :return: A dictionary with characters as keys and their frequencies as values.
         """
-        char_frequency = {}
-
-        for c in content:
-            if c not in char_frequency:
-                char_frequency[c] = 1
-            else:
-                char_frequency[c] += 1
-
-        return char_frequency
+        return Counter(content)
 
     def build_tree(self, content: str) -> 'HuffNode':
         """
@@ -36,88 +41,197 @@ class HuffmanEncoding:
         :return: The root node of the Huffman tree.
         """
         freq_by_char = self.get_char_frequency(content=content)
-        print('\t\tFrequence by char:', freq_by_char)
+        print('\t\tFrequence by char:', dict(freq_by_char))
 
-        nodes = [HuffNode(char=c, freq=f) for c, f in freq_by_char.items()]
-        h = BinaryHeap(nodes, criteria=(lambda a, b: a < b))
+        # The counter breaks frequency ties, so the heap never has to compare the nodes themselves.
+        tie_breaker = count()
+        h = [(f, next(tie_breaker), HuffNode(char=c, freq=f)) for c, f in freq_by_char.items()]
+        heapq.heapify(h)
 
         while len(h) > 1:
-            node1 = h.pop()
-            node2 = h.pop()
+            _, _, node1 = heapq.heappop(h)
+            _, _, node2 = heapq.heappop(h)
 
-            merged = HuffNode(None, node1.freq +
-                              node2.freq if node2 else node1.freq)
+            merged = HuffNode(None, node1.freq + node2.freq)
             merged.left = node1
             merged.right = node2
-            h.push(merged)
+            heapq.heappush(h, (merged.freq, next(tie_breaker), merged))
 
-        return h.pop()
+        return h[0][2] if h else None
 
-    def build_codes(self, node: 'HuffNode', prefix: str = '', code: dict = None) -> dict:
+    def build_codes(self, node: 'HuffNode') -> dict:
         """
         Method to build the Huffman codes for characters.
-        :param node: The current node in the Huffman tree.
-        :param prefix: The current Huffman code prefix.
-        :param code: The dictionary to store Huffman codes.
-        :return: A dictionary with characters as keys and their Huffman codes as values.
+        :param node: The root node of the Huffman tree.
+        :return: A dictionary with characters as keys and their Huffman codes as (bits, number of bits) tuples as values.
         """
-        if code is None:
-            code = {}
+        code = {}
+        stack = [(node, 0, 0)] if node is not None else []
 
-        if node is not None:
-            if node.char is not None:
-                code[node.char] = prefix
+        while stack:
+            node, bits, nbits = stack.pop()
 
-            self.build_codes(node.left, prefix + '0', code)
-            self.build_codes(node.right, prefix + '1', code)
+            if node.char is not None:
+                code[node.char] = (bits, nbits)
+            else:
+                stack.append((node.left, bits << 1, nbits + 1))
+                stack.append((node.right, (bits << 1) | 1, nbits + 1))
 
         return code
 
-    def __encode(self, text: str, code: dict) -> str:
+    def __encode(self, text: str, code: dict) -> bytes:
         """
         Private method to encode the given text using the Huffman codes.
         :param text: The text to encode.
         :param code: The Huffman codes dictionary.
-        :return: The encoded text as a string of bits.
+        :return: The encoded text packed into bytes, most significant bit first and zero-padded at the end.
         """
-        return ''.join(code[char] for char in text)
+        # The compiled encoder keeps codes in a 64-bit buffer, which holds up to 56 bits next to a pending byte.
+        if _encode_c is not None and code and max(nbits for _, nbits in code.values()) <= 56:
+            return self.__encode_c(text, code)
+
+        encoded = bytearray()
+        buffer, buffered = 0, 0
+
+        for char in text:
+            bits, nbits = code[char]
+            buffer = (buffer << nbits) | bits
+            buffered += nbits
+
+            # Flush whole bytes in blocks, keeping the buffer small enough for cheap shifts.
+            if buffered >= 512:
+                whole = buffered & ~7
+                encoded += (buffer >> (buffered - whole)).to_bytes(whole // 8, 'big')
+                buffered -= whole
+                buffer &= (1 << buffered) - 1
 
-    def __decode(self, encoded_text: str, root: 'HuffNode') -> str:
+        if buffered:
+            padded = (buffered + 7) & ~7
+            encoded += (buffer << (padded - buffered)).to_bytes(padded // 8, 'big')
+
+        return bytes(encoded)
+
+    def __encode_c(self, text: str, code: dict) -> bytes:
+        """
+        Private method to encode the given text using the Huffman codes with the compiled encoder.
+        :param text: The text to encode.
+        :param code: The Huffman codes dictionary.
+        :return: The encoded text packed into bytes, most significant bit first and zero-padded at the end.
+        """
+        chars = sorted(code, key=ord)
+        alphabet = np.array([ord(char) for char in chars], dtype=np.uint32)
+        bits = np.array([code[char][0] for char in chars], dtype=np.uint64)
+        nbits = np.array([code[char][1] for char in chars], dtype=np.uint8)
+
+        code_points = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        symbols = np.searchsorted(alphabet, code_points).astype(np.uint32)
+
+        return _encode_c(symbols, bits, nbits)
+
+    def __decode(self, encoded_text: bytes, root: 'HuffNode') -> str:
         """
-        Private method to decode the given encoded text using the Huffman tree.
-        :param encoded_text: The encoded text as a string of bits.
+        Private method to decode the given encoded text using the Huffman tree. For small alphabets, each internal
+        node of the tree is a state and every input byte is decoded with a single lookup in a transition table, filled
+        on first use. Larger alphabets rarely revisit a (state, byte) pair, so they are decoded bit by bit instead.
+        :param encoded_text: The encoded text packed into bytes.
         :param root: The root of the Huffman tree.
         :return: The decoded text.
         """
+        if root is None:
+            return ''
+
+        if root.char is not None:
+            return root.char * root.freq
+
+        states = []
+        state_by_node = {}
+        stack = [root]
+
+        while stack:
+            node = stack.pop()
+            if node.char is None:
+                state_by_node[node] = len(states)
+                states.append(node)
+                stack.extend((node.right, node.left))
+
+        if len(states) > MAX_TABLE_STATES:
+            return self.__decode_bits(encoded_text, root)
+
+        transitions = [None] * (len(states) * 256)
+        decoded_text = []
+        state = 0
+
+        for byte in encoded_text:
+            transition = transitions[state * 256 + byte]
+
+            if transition is None:
+                transition = self.__walk(states[state], byte, root, state_by_node)
+                transitions[state * 256 + byte] = transition
+
+            chars, state = transition
+            decoded_text.append(chars)
+
+        # The root frequency is the length of the text, anything past it comes from the padding bits.
+        return ''.join(decoded_text)[:root.freq]
+
+    def __decode_bits(self, encoded_text: bytes, root: 'HuffNode') -> str:
+        """
+        Private method to decode the given encoded text by walking the Huffman tree one bit at a time.
+        :param encoded_text: The encoded text packed into bytes.
+        :param root: The root of the Huffman tree.
+        :return: The decoded text.
+        """
+        bits = format(int.from_bytes(encoded_text, 'big'), f'0{len(encoded_text) * 8}b') if encoded_text else ''
+
         decoded_text = []
         node = root
-        for bit in encoded_text:
-            if bit == '0':
-                node = node.left
-            else:
-                node = node.right
+        for bit in bits:
+            node = node.left if bit == '0' else node.right
 
             if node.char is not None:
                 decoded_text.append(node.char)
+                if len(decoded_text) == root.freq:
+                    break
+
                 node = root
 
         return ''.join(decoded_text)
 
+    def __walk(self, node: 'HuffNode', byte: int, root: 'HuffNode', state_by_node: dict) -> tuple:
+        """
+        Private method to walk the Huffman tree through the bits of a byte.
+        :param node: The internal node to start the walk from.
+        :param byte: The byte whose bits are followed, most significant bit first.
+        :param root: The root of the Huffman tree.
+        :param state_by_node: The dictionary mapping internal nodes to their state number.
+        :return: A tuple containing the decoded characters and the state where the walk ends.
+        """
+        chars = []
+
+        for shift in range(7, -1, -1):
+            node = node.right if (byte >> shift) & 1 else node.left
+
+            if node.char is not None:
+                chars.append(node.char)
+                node = root
+
+        return ''.join(chars), state_by_node[node]
+
     def encoding(self, text: str) -> tuple:
         """
         Method to encode the given text and return the encoded text and Huffman tree.
         :param text: The text to encode.
-        :return: A tuple containing the encoded text and the root of the Huffman tree.
+        :return: A tuple containing the encoded text as bytes and the root of the Huffman tree.
         """
         root = self.build_tree(text)
         code = self.build_codes(root)
         enc = self.__encode(text, code)
         return enc, root
 
-    def decoding(self, encoded_text: str, root: 'HuffNode') -> str:
+    def decoding(self, encoded_text: bytes, root: 'HuffNode') -> str:
         """
         Method to decode the given encoded text using the Huffman tree.
-        :param encoded_text: The encoded text as a string of bits.
+        :param encoded_text: The encoded text as bytes.
         :param root: The root of the Huffman tree.
         :return: The decoded text.
         """
@@ -0,0 +1,5 @@
+from setuptools import Extension, find_namespace_packages, setup
+from Cython.Build import cythonize
+
+setup(packages=find_namespace_packages(include=['compression', 'compression.*']),
+      ext_modules=cythonize([Extension('compression.text._huffman_c', ['compression/text/_huffman_c.pyx'])]))